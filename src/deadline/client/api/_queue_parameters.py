@@ -3,6 +3,8 @@ from __future__ import annotations
 
 __all__ = ["get_queue_parameter_definitions"]
 
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
 
 from ._list_apis import _call_paginated_deadline_list_api
@@ -31,17 +33,26 @@ def get_queue_parameter_definitions(
         farmId=farmId,
         queueId=queueId,
     )
-    queue_environments = sorted(
-        (
-            deadline.get_queue_environment(
-                farmId=farmId,
-                queueId=queueId,
-                queueEnvironmentId=queue_env["queueEnvironmentId"],
-            )
-            for queue_env in response["environments"]
-        ),
-        key=lambda queue_env: queue_env["priority"],
-    )
+    queue_environment_ids = [
+        queue_env["queueEnvironmentId"] for queue_env in response["environments"]
+    ]
+
+    def _get_queue_environment(queue_environment_id: str) -> dict:
+        return deadline.get_queue_environment(
+            farmId=farmId, queueId=queueId, queueEnvironmentId=queue_environment_id
+        )
+
+    # The queue environments are independent of each other, so fetch them concurrently
+    # instead of paying a full round trip per environment.
+    if queue_environment_ids:
+        with ThreadPoolExecutor(
+            max_workers=min(len(queue_environment_ids), 8),
+            thread_name_prefix="GetQueueEnvironment",
+        ) as executor:
+            queue_environments = list(executor.map(_get_queue_environment, queue_environment_ids))
+    else:
+        queue_environments = []
+    queue_environments.sort(key=lambda queue_env: queue_env["priority"])
     queue_environment_templates = [
         yaml.safe_load(queue_env["template"]) for queue_env in queue_environments
     ]
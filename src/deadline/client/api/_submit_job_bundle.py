@@ -11,7 +11,7 @@ import time
 import os
 import textwrap
 from configparser import ConfigParser
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from botocore.client import BaseClient  # type: ignore[import]
 
@@ -225,22 +225,18 @@ def create_job_from_job_bundle(
                     asset_references.referenced_paths.add(directory)
                 continue
 
-            is_dir_empty = True
-            for root, _, files in os.walk(directory):
-                if not files:
-                    continue
-                is_dir_empty = False
-                asset_references.input_filenames.update(
-                    os.path.normpath(os.path.join(root, file)) for file in files
-                )
+            directory_files = {
+                os.path.normpath(file_path) for file_path in _iter_files_in_directory(directory)
+            }
+            asset_references.input_filenames.update(directory_files)
             # Empty directories just become references since there's nothing to upload
-            if is_dir_empty:
+            if not directory_files:
                 logger.info(f"Input directory '{directory}' is empty. Adding to referenced paths.")
                 asset_references.referenced_paths.add(directory)
         asset_references.input_directories.clear()
 
         if missing_directories:
-            all_missing_directories = "\n\t".join(sorted(list(missing_directories)))
+            all_missing_directories = "\n\t".join(sorted(missing_directories))
             misconfigured_directories_msg = (
                 "Job submission contains misconfigured input directories and cannot be submitted."
                 " All input directories must exist."
@@ -396,6 +392,34 @@ def wait_for_create_job_to_complete(
     )
 
 
+def _iter_files_in_directory(directory: str) -> Iterator[str]:
+    """
+    Yields the paths of all the files under the given directory, recursively.
+
+    This matches the files that os.walk(directory) reports (symlinked directories are listed
+    but not descended into, unreadable directories are skipped). Both use os.scandir, but this
+    yields each DirEntry.path directly instead of building per-directory lists of names and
+    joining every file name back onto its directory.
+    """
+    pending_dirs = [directory]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            scandir_it = os.scandir(current_dir)
+        except OSError:
+            continue
+        with scandir_it:
+            for entry in scandir_it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    yield entry.path
+                elif not entry.is_symlink():
+                    pending_dirs.append(entry.path)
+
+
 def _hash_attachments(
     asset_manager: S3AssetManager,
     asset_groups: list[AssetRootGroup],
@@ -31,6 +31,7 @@ from qtpy.QtWidgets import (  # pylint: disable=import-error; type: ignore
 )
 
 from deadline.client import api
+from deadline.client.api._submit_job_bundle import _iter_files_in_directory
 from deadline.client.exceptions import (
     CreateJobWaiterCanceled,
     DeadlineOperationError,
@@ -259,16 +260,12 @@ class SubmitJobProgressDialog(QDialog):
                         self.asset_references.referenced_paths.add(directory)
                     continue
 
-                is_dir_empty = True
-                for root, _, files in os.walk(directory):
-                    if not files:
-                        continue
-                    is_dir_empty = False
-                    self.asset_references.input_filenames.update(
-                        os.path.normpath(os.path.join(root, file)) for file in files
-                    )
+                directory_files = {
+                    os.path.normpath(path) for path in _iter_files_in_directory(directory)
+                }
+                self.asset_references.input_filenames.update(directory_files)
                 # Empty directories just become references since there's nothing to upload
-                if is_dir_empty:
+                if not directory_files:
                     logging.info(
                         f"Input directory '{directory}' is empty. Adding to referenced paths."
                     )
@@ -282,7 +279,7 @@ class SubmitJobProgressDialog(QDialog):
                     " All input directories must exist."
                 )
 
-                missing_directory_list = sorted(list(missing_directories))
+                missing_directory_list = sorted(missing_directories)
                 sample_of_missing_directories = "\n\t".join(missing_directory_list[:sample_size])
                 sample_of_misconfigured_inputs = (
                     f"\nNon-existent directories:\n\t{sample_of_missing_directories}\n"
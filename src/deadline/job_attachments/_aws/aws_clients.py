@@ -70,6 +70,9 @@ def get_s3_client(session: Optional[boto3.Session] = None) -> BaseClient:
             retries={"mode": S3_RETRIES_MODE},
             user_agent_extra=f"S3A/Deadline/NA/JobAttachments/{version}",
             max_pool_connections=s3_max_pool_connections,
+            # Send TCP keep-alives so idle pooled connections aren't dropped by firewalls or NATs
+            # between transfers, which would force a new TCP and TLS handshake on reuse.
+            tcp_keepalive=True,
         ),
         endpoint_url=f"https://s3.{session.region_name}.amazonaws.com",
     )
@@ -102,8 +105,16 @@ def get_s3_max_pool_connections() -> int:
 
 
 @lru_cache(maxsize=MAX_SIZE_CACHE)
-def get_s3_transfer_manager(s3_client: BaseClient):
-    transfer_config = boto3.s3.transfer.TransferConfig()
+def get_s3_transfer_manager(s3_client: BaseClient, num_file_workers: int = 0):
+    # The transfer manager runs the requests of all of its transfers (every part of a multipart
+    # upload/download, across all files) on a single shared thread pool, sized to the S3 client's
+    # connection pool. Callers whose file worker threads also make requests of their own on the
+    # same client (like the uploader's head_object checks) pass the number of those workers, and
+    # one connection is left in the pool for each of them. This keeps the requests in flight
+    # within the pool and avoids "Connection pool is full" churn.
+    transfer_config = boto3.s3.transfer.TransferConfig(
+        max_concurrency=max(1, get_s3_max_pool_connections() - num_file_workers),
+    )
     return create_transfer_manager(client=s3_client, config=transfer_config)
 
 
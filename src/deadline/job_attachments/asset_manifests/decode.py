@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Tuple
 
@@ -25,6 +26,18 @@ def _get_schema(version) -> dict[str, Any]:
         return json.load(schema_file)
 
 
+@lru_cache(maxsize=None)
+def _get_validator(version: ManifestVersion) -> jsonschema.protocols.Validator:
+    """
+    Returns a validator for the given manifest version's schema. Loading the schema and checking it
+    against its metaschema is far more expensive than validating a manifest, so it's only done once.
+    """
+    schema = _get_schema(version)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
 def validate_manifest(
     manifest: dict[str, Any], version: ManifestVersion
 ) -> Tuple[bool, Optional[str]]:
@@ -33,7 +46,9 @@ def validate_manifest(
     is valid for the given version. Returns False and a string explaining the error if the manifest is not valid.
     """
     try:
-        jsonschema.validate(manifest, _get_schema(version))
+        error = jsonschema.exceptions.best_match(_get_validator(version).iter_errors(manifest))
+        if error is not None:
+            raise error
 
     except (jsonschema.ValidationError, jsonschema.SchemaError) as e:
         return False, str(e)
@@ -2,12 +2,15 @@
 
 """ Module that defines the hashing algorithms supported by this library. """
 
-import io
+import os
 
 from enum import Enum
 
 from ..exceptions import UnsupportedHashingAlgorithmError
 
+# Maximum size of the chunks that files are read in while hashing.
+HASH_READ_BUFFER_SIZE: int = 1024 * 1024  # 1 MiB
+
 
 class HashAlgorithm(str, Enum):
     """
@@ -32,25 +35,25 @@ def hash_file(file_path: str, hash_alg: HashAlgorithm) -> str:
             f"Unsupported hashing algorithm provided: {hash_alg}"
         )
 
-    with open(file_path, "rb") as file:
+    with open(file_path, "rb", buffering=0) as file:
+        # Don't allocate more than the file needs, so hashing many small files stays cheap.
+        buffer = bytearray(min(os.fstat(file.fileno()).st_size, HASH_READ_BUFFER_SIZE) or 1)
+        view = memoryview(buffer)
         while True:
-            chunk = file.read(io.DEFAULT_BUFFER_SIZE)
-            if not chunk:
+            bytes_read = file.readinto(buffer)
+            if not bytes_read:
                 break
-            hasher.update(chunk)
+            hasher.update(view[:bytes_read])
         return hasher.hexdigest()
 
 
 def hash_data(data: bytes, hash_alg: HashAlgorithm) -> str:
     """Hashes the given data bytes using the given hashing algorithm."""
     if hash_alg == HashAlgorithm.XXH128:
-        from xxhash import xxh3_128
+        from xxhash import xxh3_128_hexdigest
 
-        hasher = xxh3_128()
+        return xxh3_128_hexdigest(data)
     else:
         raise UnsupportedHashingAlgorithmError(
             f"Unsupported hashing algorithm provided: {hash_alg}"
         )
-
-    hasher.update(data)
-    return hasher.hexdigest()
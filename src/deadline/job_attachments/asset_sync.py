@@ -191,7 +191,7 @@ class AssetSync:
             "paths": paths,
             "hash_alg": self.hash_alg,
         }
-        asset_manifest_args["total_size"] = sum([output.file_size for output in outputs])
+        asset_manifest_args["total_size"] = sum(output.file_size for output in outputs)
 
         return self.manifest_model.AssetManifest(**asset_manifest_args)  # type: ignore[call-arg]
 
@@ -71,6 +71,9 @@ from ._utils import _is_relative_to, _join_s3_paths
 
 download_logger = getLogger("deadline.job_attachments.download")
 
+# The number of S3 connections budgeted for each thread worker that downloads files in parallel.
+# This is used to determine the max number of download workers. The workers make all of their S3
+# requests through the shared S3 transfer manager, so none of the pool is reserved for them.
 S3_DOWNLOAD_MAX_CONCURRENCY = 10
 
 
@@ -518,7 +521,7 @@ def download_file(
     except Exception as e:
         raise AssetSyncError(e) from e
 
-    download_logger.debug(f"Downloaded {file.path} to {str(local_file_name)}")
+    download_logger.debug("Downloaded %s to %s", file.path, local_file_name)
     os.utime(local_file_name, (modified_time_override, modified_time_override))  # type: ignore[arg-type]
 
     return (file_bytes, local_file_name)
@@ -795,8 +798,9 @@ def download_files_from_manifests(
 def _get_num_download_workers() -> int:
     """
     Determines the max number of thread workers for downloading multiple files in parallel,
-    based on the allowed S3 max pool connections size. If the max worker count is calculated
-    to be 0 due to a small pool connections size limit, it returns 1.
+    based on the allowed S3 max pool connections size and the connections budgeted per worker
+    (S3_DOWNLOAD_MAX_CONCURRENCY). If the max worker count is calculated to be 0 due to a small
+    pool connections size limit, it returns 1.
     """
     num_download_workers = int(get_s3_max_pool_connections() / S3_DOWNLOAD_MAX_CONCURRENCY)
     if num_download_workers <= 0:
@@ -870,15 +874,15 @@ def merge_asset_manifests(manifests: list[BaseAssetManifest]) -> BaseAssetManife
                 f"Merging manifests with different hash algorithms is not supported.  {manifest.hashAlg.value} does not match {hash_alg.value}"
             )
 
-        for path in manifest.paths:
-            merged_paths[path.path] = path
+        merged_paths.update((path.path, path) for path in manifest.paths)
 
+    paths = list(merged_paths.values())
     manifest_args: dict[str, Any] = {
         "hash_alg": hash_alg,
-        "paths": list(merged_paths.values()),
+        "paths": paths,
     }
 
-    total_size = sum([path.size for path in merged_paths.values()])  # type: ignore
+    total_size = sum(path.size for path in paths)  # type: ignore
     manifest_args["total_size"] = total_size
 
     output_manifest: BaseAssetManifest = first_manifest.__class__(**manifest_args)
@@ -6,7 +6,7 @@ Classes for handling uploading of assets.
 from __future__ import annotations
 
 import concurrent.futures
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 import errno
 import logging
 import os
@@ -16,7 +16,7 @@ from datetime import datetime
 from io import BufferedReader, BytesIO
 from math import trunc
 from pathlib import Path, PurePath
-from typing import Any, Callable, Generator, Optional, Tuple, Type, Union
+from typing import Any, Callable, Generator, Iterable, Optional, Tuple, Type, Union
 
 import boto3
 from boto3.s3.transfer import ProgressCallbackInvoker
@@ -77,8 +77,10 @@ logger = logging.getLogger("deadline.job_attachments.upload")
 # The default multipart upload chunk size is 8 MB. We used this to determine the small file threshold,
 # which is the chunk size multiplied by the small file threshold multiplier.
 S3_MULTIPART_UPLOAD_CHUNK_SIZE: int = 8388608  # 8 MB
-# The maximum number of concurrency for multipart uploads. This is used to determine the max number
-# of thread workers for uploading multiple small files in parallel.
+# The number of S3 connections budgeted for each thread worker that uploads small files in parallel.
+# This is used to determine the max number of upload workers. Each worker keeps one connection for
+# its own requests (e.g. head_object), and the file parts it hands to the shared S3 transfer manager
+# run on the rest of the pool.
 S3_UPLOAD_MAX_CONCURRENCY: int = 10
 
 
@@ -165,7 +167,9 @@ class S3AssetUploader:
 
         # Upload asset manifest
         hash_alg = manifest.get_default_hash_alg()
-        manifest_bytes = manifest.encode().encode("utf-8")
+        # Encode the manifest once, it is used for both the local copy and the S3 upload.
+        manifest_data = manifest.encode()
+        manifest_bytes = manifest_data.encode("utf-8")
         manifest_name_prefix = hash_data(
             f"{file_system_location_name or ''}{str(source_root)}".encode(), hash_alg
         )
@@ -182,7 +186,7 @@ class S3AssetUploader:
 
         if manifest_write_dir:
             self._write_local_manifest(
-                manifest_write_dir, manifest_name, full_manifest_key, manifest
+                manifest_write_dir, manifest_name, full_manifest_key, manifest_data
             )
 
         self.upload_bytes_to_s3(
@@ -208,17 +212,17 @@ class S3AssetUploader:
         manifest_write_dir: str,
         manifest_name: str,
         full_manifest_key: str,
-        manifest: BaseAssetManifest,
+        manifest_data: str,
     ) -> None:
         """
-        Writes a manifest file locally in a 'manifests' sub-directory.
+        Writes an encoded manifest file locally in a 'manifests' sub-directory.
         Also creates/appends to a file mapping the local manifest name to the full S3 key in the same directory.
         """
         local_manifest_file = Path(manifest_write_dir, "manifests", manifest_name)
         logger.info(f"Creating local manifest file: {local_manifest_file}\n")
         local_manifest_file.parent.mkdir(parents=True, exist_ok=True)
         with open(local_manifest_file, "w") as file:
-            file.write(manifest.encode())
+            file.write(manifest_data)
 
         # Create or append to an existing mapping file. We use this since path lengths can go beyond the
         # file name length limit on Windows if we were to create the full S3 key path locally.
@@ -339,17 +343,23 @@ class S3AssetUploader:
         if s3_cas_prefix:
             s3_upload_key = _join_s3_paths(s3_cas_prefix, s3_upload_key)
         is_uploaded = False
-        file_size = local_path.resolve().stat().st_size
+        file_size = local_path.stat().st_size
 
         if s3_check_cache.get_entry(s3_key=f"{s3_bucket}/{s3_upload_key}"):
             logger.debug(
-                f"skipping {local_path} because {s3_bucket}/{s3_upload_key} exists in the cache"
+                "skipping %s because %s/%s exists in the cache",
+                local_path,
+                s3_bucket,
+                s3_upload_key,
             )
             return (is_uploaded, file_size)
 
         if self.file_already_uploaded(s3_bucket, s3_upload_key):
             logger.debug(
-                f"skipping {local_path} because it has already been uploaded to s3://{s3_bucket}/{s3_upload_key}"
+                "skipping %s because it has already been uploaded to s3://%s/%s",
+                local_path,
+                s3_bucket,
+                s3_upload_key,
             )
         else:
             self.upload_file_to_s3(
@@ -383,7 +393,9 @@ class S3AssetUploader:
         which also checks if the upload should continue or not. If the `progress_tracker`
         signals to stop, the ongoing upload is cancelled.
         """
-        transfer_manager = get_s3_transfer_manager(s3_client=self._s3)
+        transfer_manager = get_s3_transfer_manager(
+            s3_client=self._s3, num_file_workers=self.num_upload_workers
+        )
 
         future: concurrent.futures.Future
 
@@ -734,7 +746,10 @@ class S3AssetManager:
 
         full_path = str(path.resolve())
         is_new_or_modified: bool = False
-        actual_modified_time = str(datetime.fromtimestamp(path.stat().st_mtime))
+        # Stat the file once up front; the modified time and size are all we need to decide
+        # whether the cached hash is still valid and to fill in the manifest entry.
+        file_stat = os.stat(full_path)
+        actual_modified_time = str(datetime.fromtimestamp(file_stat.st_mtime))
 
         entry: Optional[HashCacheEntry] = hash_cache.get_entry(full_path, hash_alg)
         if entry is not None:
@@ -756,7 +771,7 @@ class S3AssetManager:
         if is_new_or_modified:
             hash_cache.put_entry(entry)
 
-        file_size = path.resolve().stat().st_size
+        file_size = file_stat.st_size
         path_args: dict[str, Any] = {
             "path": path.relative_to(root_path).as_posix(),
             "hash": entry.file_hash,
@@ -764,7 +779,7 @@ class S3AssetManager:
 
         # stat().st_mtime_ns returns an int that represents the time in nanoseconds since the epoch.
         # The asset manifest spec requires the mtime to be represented as an integer in microseconds.
-        path_args["mtime"] = trunc(path.stat().st_mtime_ns // 1000)
+        path_args["mtime"] = trunc(file_stat.st_mtime_ns // 1000)
         path_args["size"] = file_size
 
         return (is_new_or_modified, file_size, manifest_model.Path(**path_args))
@@ -784,7 +799,9 @@ class S3AssetManager:
         }:
             paths: list[base_manifest.BaseManifestPath] = []
 
-            with concurrent.futures.ThreadPoolExecutor() as executor:
+            with concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="JobAttachmentsHashing"
+            ) as executor:
                 futures = {
                     executor.submit(
                         self._process_input_path, path, root_path, hash_cache, progress_tracker
@@ -809,7 +826,7 @@ class S3AssetManager:
                 "paths": paths,
             }
 
-            manifest_args["total_size"] = sum([path.size for path in paths])
+            manifest_args["total_size"] = sum(path.size for path in paths)
 
             return manifest_model.AssetManifest(**manifest_args)
         else:
@@ -996,7 +1013,7 @@ class S3AssetManager:
         total_bytes = 0
         try:
             for path in paths:
-                total_bytes += Path(path).resolve().stat().st_size
+                total_bytes += os.stat(path).st_size
         except FileNotFoundError:
             logger.warning(
                 f"Skipping the input from total size calculation as it doesn't exist: {path}"
@@ -1011,10 +1028,8 @@ class S3AssetManager:
         for asset_root_manifest in manifests:
             if asset_root_manifest.asset_manifest:
                 input_paths = asset_root_manifest.asset_manifest.paths
-                input_paths_str = [
-                    str(Path(asset_root_manifest.root_path).joinpath(path.path))
-                    for path in input_paths
-                ]
+                root_path = asset_root_manifest.root_path
+                input_paths_str = [os.path.join(root_path, path.path) for path in input_paths]
                 total_files += len(input_paths)
                 total_bytes += self._get_total_size_of_files(input_paths_str)
 
@@ -1051,9 +1066,9 @@ class S3AssetManager:
 
     def _group_asset_paths(
         self,
-        input_paths: list[str],
-        output_paths: list[str],
-        referenced_paths: list[str],
+        input_paths: Iterable[str],
+        output_paths: Iterable[str],
+        referenced_paths: Iterable[str],
         storage_profile: Optional[StorageProfile] = None,
         require_paths_exist: bool = False,
     ) -> list[AssetRootGroup]:
@@ -1082,9 +1097,9 @@ class S3AssetManager:
 
     def prepare_paths_for_upload(
         self,
-        input_paths: list[str],
-        output_paths: list[str],
-        referenced_paths: list[str],
+        input_paths: Iterable[str],
+        output_paths: Iterable[str],
+        referenced_paths: Iterable[str],
         storage_profile: Optional[StorageProfile] = None,
         require_paths_exist: bool = False,
     ) -> AssetUploadGroup:
@@ -1140,24 +1155,28 @@ class S3AssetManager:
         )
 
         asset_root_manifests: list[AssetRootManifest] = []
-        for group in asset_groups:
-            # Might have output directories, but no inputs for this group
-            asset_manifest: Optional[BaseAssetManifest] = None
-            if group.inputs:
-                # Create manifest, using local hash cache
-                with HashCache(hash_cache_dir) as hash_cache:
+        with ExitStack() as exit_stack:
+            # Opened on the first group with inputs, then shared across the remaining groups
+            hash_cache: Optional[HashCache] = None
+            for group in asset_groups:
+                # Might have output directories, but no inputs for this group
+                asset_manifest: Optional[BaseAssetManifest] = None
+                if group.inputs:
+                    if hash_cache is None:
+                        hash_cache = exit_stack.enter_context(HashCache(hash_cache_dir))
+                    # Create manifest, using local hash cache
                     asset_manifest = self._create_manifest_file(
-                        sorted(list(group.inputs)), group.root_path, hash_cache, progress_tracker
+                        sorted(group.inputs), group.root_path, hash_cache, progress_tracker
                     )
 
-            asset_root_manifests.append(
-                AssetRootManifest(
-                    file_system_location_name=group.file_system_location_name,
-                    root_path=group.root_path,
-                    asset_manifest=asset_manifest,
-                    outputs=sorted(list(group.outputs)),
+                asset_root_manifests.append(
+                    AssetRootManifest(
+                        file_system_location_name=group.file_system_location_name,
+                        root_path=group.root_path,
+                        asset_manifest=asset_manifest,
+                        outputs=sorted(group.outputs),
+                    )
                 )
-            )
 
         progress_tracker.total_time = time.perf_counter() - start_time
 
@@ -1226,18 +1245,19 @@ class S3AssetManager:
 
             manifest_properties_list.append(manifest_properties)
 
-            logger.debug("Asset manifests - locations in S3:")
-            logger.debug(
-                "\n".join(
-                    filter(
-                        None,
-                        (
-                            manifest_properties.inputManifestPath
-                            for manifest_properties in manifest_properties_list
-                        ),
+            if logging.DEBUG >= logger.getEffectiveLevel():
+                logger.debug("Asset manifests - locations in S3:")
+                logger.debug(
+                    "\n".join(
+                        filter(
+                            None,
+                            (
+                                manifest_properties.inputManifestPath
+                                for manifest_properties in manifest_properties_list
+                            ),
+                        )
                     )
                 )
-            )
 
         progress_tracker.total_time = time.perf_counter() - start_time
 
@@ -1122,3 +1122,59 @@ def test_wait_for_create_job_to_complete_timeout():
             deadline_client=deadline_client,
             continue_callback=mock_continue_callback,
         )
+
+
+def test_iter_files_in_directory_matches_os_walk(tmp_path):
+    """
+    Test that the scandir-based directory traversal finds the same files as os.walk.
+    """
+    # GIVEN
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "top.txt").touch()
+    (tmp_path / "a" / "a.txt").touch()
+    (tmp_path / "a" / "b" / "b.txt").touch()
+
+    expected_files = {
+        os.path.join(root, file) for root, _, files in os.walk(tmp_path) for file in files
+    }
+
+    # WHEN
+    files = set(_submit_job_bundle._iter_files_in_directory(str(tmp_path)))
+
+    # THEN
+    assert files == expected_files
+    assert files == {
+        str(tmp_path / "top.txt"),
+        str(tmp_path / "a" / "a.txt"),
+        str(tmp_path / "a" / "b" / "b.txt"),
+    }
+
+
+def test_iter_files_in_directory_does_not_follow_directory_symlinks(tmp_path):
+    """
+    Test that the scandir-based directory traversal, like os.walk, doesn't descend into
+    symlinked directories.
+    """
+    # GIVEN
+    bundle_dir = tmp_path / "bundle"
+    bundle_dir.mkdir()
+    (bundle_dir / "top.txt").touch()
+    outside_dir = tmp_path / "outside"
+    outside_dir.mkdir()
+    (outside_dir / "outside.txt").touch()
+    try:
+        os.symlink(outside_dir, bundle_dir / "linked_dir", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Creating symlinks is not permitted on this system")
+
+    expected_files = {
+        os.path.join(root, file) for root, _, files in os.walk(bundle_dir) for file in files
+    }
+
+    # WHEN
+    files = set(_submit_job_bundle._iter_files_in_directory(str(bundle_dir)))
+
+    # THEN
+    assert files == expected_files
+    assert files == {str(bundle_dir / "top.txt")}
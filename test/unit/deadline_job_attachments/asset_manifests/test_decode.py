@@ -58,7 +58,20 @@ def test_validate_manifest_manifest_not_valid_manifest(manifest_params: list[Man
         )
 
 
-def test_validate_manifest_not_valid_schema(manifest_params: list[ManifestParam]):
+@pytest.fixture
+def clear_validator_cache():
+    """
+    Clears the cached manifest schema validators before and after the test, so that
+    patched schemas don't leak in from, or out to, other tests.
+    """
+    decode._get_validator.cache_clear()
+    yield
+    decode._get_validator.cache_clear()
+
+
+def test_validate_manifest_not_valid_schema(
+    manifest_params: list[ManifestParam], clear_validator_cache
+):
     """
     Test that a manifest is returned as not valid with an expected error string if the schema isn't valid
     """
@@ -87,6 +100,29 @@ def test_validate_manifest_not_valid_schema(manifest_params: list[ManifestParam]
             assert error_str.startswith("'bad_type' is not valid under any of the given schemas")
 
 
+def test_validate_manifest_loads_schema_once(
+    manifest_params: list[ManifestParam], clear_validator_cache
+):
+    """
+    Test that the schema for a manifest version is only loaded once across validations.
+    """
+    with patch(
+        f"{deadline.__package__}.job_attachments.asset_manifests.decode._get_schema",
+        wraps=decode._get_schema,
+    ) as mock_get_schema:
+        for manifest_param in manifest_params:
+            manifest: dict[str, Any] = json.loads(manifest_param.manifest_str)
+            for _ in range(3):
+                assert decode.validate_manifest(manifest, manifest_param.manifest_version) == (
+                    True,
+                    None,
+                )
+
+    assert mock_get_schema.call_count == len(
+        {manifest_param.manifest_version for manifest_param in manifest_params}
+    )
+
+
 def test_decode_manifest_v2023_03_03(default_manifest_str_v2023_03_03: str):
     """
     Test that a v2023-03-03 manifest string decodes to an AssetManifest object as expected.
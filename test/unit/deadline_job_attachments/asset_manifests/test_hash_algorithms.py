@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""Tests for the hashing functions used by the asset manifests."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from xxhash import xxh3_128
+
+from deadline.job_attachments.asset_manifests import hash_algorithms
+from deadline.job_attachments.asset_manifests.hash_algorithms import (
+    HashAlgorithm,
+    hash_data,
+    hash_file,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b"test", id="small"),
+        pytest.param(os.urandom(3 * 1024 * 1024 + 7), id="multiple chunks"),
+    ],
+)
+def test_hash_file(tmp_path, data: bytes):
+    """Tests that hashing a file gives the same result as hashing its contents."""
+    test_file = tmp_path / "test_file"
+    test_file.write_bytes(data)
+
+    assert hash_file(str(test_file), HashAlgorithm.XXH128) == xxh3_128(data).hexdigest()
+    assert hash_data(data, HashAlgorithm.XXH128) == xxh3_128(data).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "size",
+    [
+        pytest.param(100, id="smaller than the buffer"),
+        pytest.param(1024, id="same size as the buffer"),
+        pytest.param(3 * 1024 + 7, id="multiple chunks"),
+    ],
+)
+def test_hash_file_read_buffer_sizes(tmp_path, size: int):
+    """Tests that files are hashed correctly whether they fit in a single read or span several."""
+    data = os.urandom(size)
+    test_file = tmp_path / "test_file"
+    test_file.write_bytes(data)
+
+    with patch.object(hash_algorithms, "HASH_READ_BUFFER_SIZE", 1024):
+        file_hash = hash_file(str(test_file), HashAlgorithm.XXH128)
+
+    assert file_hash == xxh3_128(data).hexdigest()
@@ -1,8 +1,10 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 """ Tests for the v2023-03-03 version of the manifest file. """
+import dataclasses
 import json
 
+from deadline.job_attachments.asset_manifests._canonical_json import _manifest_to_dict
 from deadline.job_attachments.asset_manifests.v2023_03_03.asset_manifest import (
     AssetManifest,
     ManifestPath,
@@ -59,6 +61,22 @@ def test_encode():
     assert a == expected
 
 
+def test_manifest_to_dict_matches_asdict():
+    """
+    Ensure the dictionary used for encoding is the same as the one dataclasses.asdict would produce.
+    """
+    manifest = AssetManifest(
+        hash_alg=HashAlgorithm("xxh128"),
+        total_size=3,
+        paths=[
+            ManifestPath(path="test_file", hash="a", size=1, mtime=167907934333848),
+            ManifestPath(path="test_dir/test_file", hash="b", size=2, mtime=1479079344833848),
+        ],
+    )
+
+    assert _manifest_to_dict(manifest) == dataclasses.asdict(manifest)
+
+
 def test_decode(default_manifest_str_v2023_03_03: str):
     """
     Ensure the expected AssetManifest is returned from the decode function.
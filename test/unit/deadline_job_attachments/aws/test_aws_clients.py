@@ -2,9 +2,13 @@
 
 """Tests for aws clients"""
 from unittest.mock import Mock, patch
+
+import pytest
+
 from deadline.job_attachments._aws.aws_clients import (
     get_deadline_client,
     get_s3_client,
+    get_s3_transfer_manager,
     get_sts_client,
 )
 import deadline
@@ -56,6 +60,33 @@ def test_get_s3_client(boto_config):
     assert s3_client.meta.config.signature_version == "s3v4"
     assert s3_client.meta.config.connect_timeout == S3_CONNECT_TIMEOUT_IN_SECS
     assert s3_client.meta.config.read_timeout == S3_READ_TIMEOUT_IN_SECS
+    assert s3_client.meta.config.tcp_keepalive is True
+
+
+@pytest.mark.parametrize(
+    "num_file_workers, expected_max_request_concurrency",
+    [
+        pytest.param(0, 42, id="no file workers"),
+        pytest.param(4, 38, id="file workers"),
+        pytest.param(42, 1, id="file workers use the whole pool"),
+    ],
+)
+def test_get_s3_transfer_manager(
+    boto_config, num_file_workers: int, expected_max_request_concurrency: int
+):
+    """
+    Test that the S3 transfer manager runs as many concurrent requests as the S3 client has
+    connections, less one for each of the file workers that share the client.
+    """
+    with patch(
+        f"{deadline.__package__}.job_attachments._aws.aws_clients.get_s3_max_pool_connections",
+        return_value=42,
+    ):
+        transfer_manager = get_s3_transfer_manager(
+            s3_client=Mock(), num_file_workers=num_file_workers
+        )
+
+    assert transfer_manager.config.max_request_concurrency == expected_max_request_concurrency
 
 
 def test_get_sts_client(boto_config):
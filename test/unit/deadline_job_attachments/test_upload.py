@@ -1129,6 +1129,36 @@ class TestUpload:
                 skipped_bytes=0,
             )
 
+    def test_hash_assets_and_create_manifest_no_inputs_skips_hash_cache(
+        self, tmpdir, farm_id, queue_id
+    ):
+        """
+        Test that the local hash cache isn't created or opened when no asset root group has inputs.
+        """
+        asset_manager = S3AssetManager(
+            farm_id=farm_id,
+            queue_id=queue_id,
+            job_attachment_settings=self.job_attachment_s3_settings,
+        )
+        output_dir = str(tmpdir.join("outputs"))
+        upload_group = asset_manager.prepare_paths_for_upload(
+            input_paths=[],
+            output_paths=[output_dir],
+            referenced_paths=[],
+        )
+
+        with patch(f"{deadline.__package__}.job_attachments.upload.HashCache") as mock_hash_cache:
+            (_, asset_root_manifests) = asset_manager.hash_assets_and_create_manifest(
+                asset_groups=upload_group.asset_groups,
+                total_input_files=upload_group.total_input_files,
+                total_input_bytes=upload_group.total_input_bytes,
+            )
+
+        mock_hash_cache.assert_not_called()
+        assert len(asset_root_manifests) == 1
+        assert asset_root_manifests[0].asset_manifest is None
+        assert asset_root_manifests[0].outputs == [Path(output_dir)]
+
     @pytest.mark.parametrize(
         "manifest_version",
         [